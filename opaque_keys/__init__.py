@@ -167,7 +167,7 @@ class OpaqueKey(metaclass=OpaqueKeyMetaclass):
         if self.deprecated:
             # no namespace on deprecated
             return self._to_deprecated_string()
-        return self.NAMESPACE_SEPARATOR.join([self.CANONICAL_NAMESPACE, self._to_string()])
+        return f"{self.CANONICAL_NAMESPACE}{self.NAMESPACE_SEPARATOR}{self._to_string()}"
 
     @classmethod
     def from_string(cls, serialized: str) -> Self:
@@ -374,9 +374,6 @@ class OpaqueKey(metaclass=OpaqueKeyMetaclass):
     def __eq__(self, other) -> bool:
         return isinstance(other, OpaqueKey) and self._key == other._key
 
-    def __ne__(self, other) -> bool:
-        return not self == other
-
     def __lt__(self, other) -> bool:
         if (self.KEY_FIELDS, self.CANONICAL_NAMESPACE, self.deprecated) != (other.KEY_FIELDS, other.CANONICAL_NAMESPACE,
                                                                             other.deprecated):
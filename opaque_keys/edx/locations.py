@@ -193,9 +193,9 @@ class DeprecatedLocation(BlockUsageLocator):
     """
     CANONICAL_NAMESPACE = 'location'
     URL_RE_SOURCE = """
-        (?P<org>{ALLOWED_ID_CHARS}+)\\+(?P<course>{ALLOWED_ID_CHARS}+)\\+(?P<run>{ALLOWED_ID_CHARS}+)\\+
-        (?P<block_type>{ALLOWED_ID_CHARS}+)\\+
-        (?P<block_id>{ALLOWED_ID_CHARS}+)
+        (?P<org>{ALLOWED_ID_CHARS}++)\\+(?P<course>{ALLOWED_ID_CHARS}++)\\+(?P<run>{ALLOWED_ID_CHARS}++)\\+
+        (?P<block_type>{ALLOWED_ID_CHARS}++)\\+
+        (?P<block_id>{ALLOWED_ID_CHARS}++)
         """.format(ALLOWED_ID_CHARS=Locator.ALLOWED_ID_CHARS)
 
     URL_RE = re.compile('^' + URL_RE_SOURCE + r'\Z', re.VERBOSE | re.UNICODE)
@@ -2,9 +2,12 @@
 Identifier for course resources.
 """
 from __future__ import annotations
+import functools
 import inspect
 import logging
 import re
+from string import ascii_letters, digits
+import sys
 from typing import Any
 import warnings
 from uuid import UUID
@@ -20,6 +23,142 @@ from opaque_keys.edx.keys import AssetKey, CourseKey, DefinitionKey, \
 
 log = logging.getLogger(__name__)
 
+# Characters that are forbidden in deprecated-format ids (and in deprecated-format names, which may contain colons)
+_DEPRECATED_INVALID_CHARS = re.compile(r"[^\w.%-]", re.UNICODE)
+_DEPRECATED_INVALID_CHARS_NAME = re.compile(r"[^\w.:%-]", re.UNICODE)
+# Characters that are forbidden in deprecated-format html ids, which can contain word chars and dashes
+_DEPRECATED_INVALID_HTML_CHARS = re.compile(r"[^\w-]", re.UNICODE)
+# The substitutions of each of those patterns by '_', as `bytes.translate` tables for ASCII values
+_DEPRECATED_INVALID_ASCII_TABLES = {
+    invalid: bytes(ord('_') if invalid.match(chr(code)) else code for code in range(128)) + bytes(range(128, 256))
+    for invalid in (_DEPRECATED_INVALID_CHARS, _DEPRECATED_INVALID_CHARS_NAME, _DEPRECATED_INVALID_HTML_CHARS)
+}
+# Runs of underscores, which `BlockUsageLocator._clean` collapses into one
+_UNDERSCORE_RUNS = re.compile('_+')
+
+
+def _cached_slot(slot, deprecated=None):
+    """
+    Return a decorator that makes a method of a key compute its result only once per key.
+
+    Keys are immutable, so the result is stored in the slot named `slot` and reused. If `deprecated` is given, only
+    keys whose `deprecated` flag equals it use the cache; the method is called afresh for the others.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def cached(self):
+            if deprecated is not None and self.deprecated != deprecated:
+                return method(self)
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                value = method(self)
+                object.__setattr__(self, slot, value)
+                return value
+        return cached
+    return decorator
+
+
+# Caches for ``_to_string`` and ``_to_deprecated_string``, which ``__str__`` goes through. A key's ``__str__`` only
+# uses one of the two (depending on whether the key is deprecated), so that one is kept, in a slot they share.
+_cache_serialization = _cached_slot('_serialized', deprecated=False)
+_cache_deprecated_serialization = _cached_slot('_serialized', deprecated=True)
+# Cache for ``__hash__``, which every dict and set lookup of a key goes through
+_cache_hash = _cached_slot('_hash')
+
+
+# Number of keys that each of the locator `_from_string` caches holds on to. Keys are immutable,
+# so the same instance can be handed out whenever a string is parsed again.
+FROM_STRING_CACHE_SIZE = 4096
+
+# Number of distinct deprecated strings whose parse results are kept by :func:`_parse_deprecated`
+DEPRECATED_PARSE_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=DEPRECATED_PARSE_CACHE_SIZE)
+def _parse_deprecated(url_re: re.Pattern, serialized: str) -> tuple[str | None, ...] | None:
+    """
+    Match `serialized` against the deprecated `url_re`.
+
+    Returns the ``(org, course, revision, category, name)`` groups, or None if it doesn't match.
+    The same deprecated strings tend to be parsed over and over (e.g. when loading
+    modulestore documents), so the results are memoized.
+    """
+    match = url_re.match(serialized)
+    if match is None:
+        return None
+    return match.group('org', 'course', 'revision', 'category', 'name')
+
+
+# The ASCII characters matched by `Locator.ALLOWED_ID_CHARS`
+_ALLOWED_ID_ASCII_CHARS = ascii_letters + digits + '_-~.:'
+
+
+def _is_plain_ascii_id(value: str) -> bool:
+    """
+    Return whether `value` is a non-empty ASCII string made up only of `Locator.ALLOWED_ID_CHARS`.
+
+    This is equivalent to (but cheaper than) matching ASCII strings against ALLOWED_ID_RE. It returns False for
+    all non-ASCII strings, which callers must then check with the regex.
+    """
+    return value.isascii() and value != '' and not value.strip(_ALLOWED_ID_ASCII_CHARS)
+
+
+# Number of distinct ids whose validity is kept by :func:`_is_valid_id`
+ID_CHECK_CACHE_SIZE = 8192
+
+
+@functools.lru_cache(maxsize=ID_CHECK_CACHE_SIZE)
+def _is_valid_id(allowed_id_re: re.Pattern, deprecated_id_re: re.Pattern | None, value: str) -> bool:
+    """
+    Return whether `value` matches `allowed_id_re` or (if given) `deprecated_id_re`.
+
+    A handful of orgs, courses, runs and block ids are seen over and over again, so the results are memoized.
+    """
+    return bool(allowed_id_re.match(value) or (deprecated_id_re is not None and deprecated_id_re.match(value)))
+
+
+# Number of distinct version ids whose ObjectIds are kept by :func:`_object_id`
+OBJECT_ID_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=OBJECT_ID_CACHE_SIZE)
+def _object_id(value: str) -> ObjectId:
+    """
+    Return the ObjectId whose hex string is `value`.
+
+    The versions of a course are referred to over and over again, so the ObjectIds are memoized.
+    """
+    return ObjectId(value)
+
+
+# Number of distinct deprecated course keys kept by :func:`_deprecated_course_key`
+DEPRECATED_COURSE_KEY_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=DEPRECATED_COURSE_KEY_CACHE_SIZE)
+def _deprecated_course_key(org: str, course: str, run: str | None, branch: str | None) -> CourseLocator:
+    """
+    Return the deprecated CourseLocator with the given fields.
+
+    Deprecated usage and asset keys are parsed in bulk (e.g. every block of a course as it is loaded), and all of
+    them share the same handful of courses, so these course keys are memoized.
+    """
+    return CourseLocator(org, course, run, branch, deprecated=True)
+
+
+# The block types that are common enough for usage keys to share their strings. Only these are interned:
+# block types come from user-supplied strings, and interned strings are never freed on Python 3.12+.
+_INTERNED_BLOCK_TYPES = frozenset({
+    'about', 'chapter', 'course', 'course_info', 'discussion', 'html', 'library_content', 'openassessment',
+    'problem', 'sequential', 'static_tab', 'vertical', 'video',
+})
+
+
+# The branch names that nearly all keys are on, and which they share the strings of. Other branches come from
+# user-supplied strings and are not interned, as interned strings are never freed on Python 3.12+.
+_INTERNED_BRANCHES = frozenset({'draft', 'published', 'library'})
+
 
 class LocalId:
     """
@@ -40,6 +179,7 @@ class Locator(OpaqueKey):
 
     Locator is an abstract base class: do not instantiate
     """
+    __slots__ = ()
 
     BLOCK_TYPE_PREFIX = r"type"
     # Prefix for the version portion of a locator URL, when it is preceded by a course ID
@@ -65,7 +205,11 @@ class Locator(OpaqueKey):
         Raises:
             ValueError: if casting fails
         """
+        if isinstance(value, ObjectId):
+            return value
         try:
+            if isinstance(value, str):
+                return _object_id(value)
             return ObjectId(value)
         except InvalidId as key_error:
             raise InvalidKeyError(cls, f'"{value}" is not a valid version_guid') from key_error
@@ -75,6 +219,8 @@ class CheckFieldMixin:
     """
     Mixin that provides handy methods for checking field types/values.
     """
+    __slots__ = ()
+
     @classmethod
     def _check_key_string_field(cls, field_name: str, value: str, regexp=re.compile(r'^[a-zA-Z0-9_\-.]+$')):
         """
@@ -85,7 +231,7 @@ class CheckFieldMixin:
         """
         if not isinstance(value, str):
             raise TypeError(f"Expected a string, got {field_name}={value!r}")
-        if not value or not re.match(regexp, value):
+        if not value or not regexp.match(value):
             raise ValueError(
                 f"{value!r} is not a valid {cls.__name__}.{field_name} field value."
             )
@@ -100,6 +246,9 @@ class BlockLocatorBase(Locator):
 
     See subclasses for more detail, particularly `CourseLocator` and `BlockUsageLocator`.
     """
+    # Hold the results of `_to_string` (or `_to_deprecated_string`) and `__hash__` once they have been computed
+    __slots__ = ('_serialized', '_hash')
+
     # Prefix for the branch portion of a locator URL
     BRANCH_PREFIX = r"branch"
     # Prefix for the block portion of a locator URL
@@ -109,12 +258,15 @@ class BlockLocatorBase(Locator):
     ALLOWED_ID_RE = re.compile(r'^' + Locator.ALLOWED_ID_CHARS + r'+\Z', re.UNICODE)
     DEPRECATED_ALLOWED_ID_RE = re.compile(r'^' + Locator.DEPRECATED_ALLOWED_ID_CHARS + r'+\Z', re.UNICODE)
 
+    # Each field is possessive: the character after it can never be part of it, so backtracking into it is futile
+    # The org/course/run group is tried first: it can only match where no other group could (an id has no '@'),
+    # and it's present in almost every key
     URL_RE_SOURCE = """
-        ((?P<org>{ALLOWED_ID_CHARS}+)\\+(?P<course>{ALLOWED_ID_CHARS}+)(\\+(?P<run>{ALLOWED_ID_CHARS}+))?{SEP})??
-        ({BRANCH_PREFIX}@(?P<branch>{ALLOWED_ID_CHARS}+){SEP})?
-        ({VERSION_PREFIX}@(?P<version_guid>[a-f0-9]+){SEP})?
-        ({BLOCK_TYPE_PREFIX}@(?P<block_type>{ALLOWED_ID_CHARS}+){SEP})?
-        ({BLOCK_PREFIX}@(?P<block_id>{BLOCK_ALLOWED_ID_CHARS}+))?
+        ((?P<org>{ALLOWED_ID_CHARS}++)\\+(?P<course>{ALLOWED_ID_CHARS}++)(\\+(?P<run>{ALLOWED_ID_CHARS}++))?{SEP})?
+        ({BRANCH_PREFIX}@(?P<branch>{ALLOWED_ID_CHARS}++){SEP})?
+        ({VERSION_PREFIX}@(?P<version_guid>[a-f0-9]++){SEP})?
+        ({BLOCK_TYPE_PREFIX}@(?P<block_type>{ALLOWED_ID_CHARS}++){SEP})?
+        ({BLOCK_PREFIX}@(?P<block_id>{BLOCK_ALLOWED_ID_CHARS}++))?
     """.format(
         ALLOWED_ID_CHARS=Locator.ALLOWED_ID_CHARS,
         BLOCK_ALLOWED_ID_CHARS=BLOCK_ALLOWED_ID_CHARS,
@@ -127,6 +279,17 @@ class BlockLocatorBase(Locator):
 
     URL_RE = re.compile('^' + URL_RE_SOURCE + r'\Z', re.VERBOSE | re.UNICODE)
 
+    @_cache_hash
+    def __hash__(self) -> int:
+        return super().__hash__()
+
+    @classmethod
+    def _invalid_field_error(cls, name: str, value: Any) -> InvalidKeyError:
+        """
+        Return the error raised when the field `name` contains characters outside ALLOWED_ID_CHARS.
+        """
+        return InvalidKeyError(cls, f"Special characters not allowed in field {name}: '{value}'")
+
     @classmethod
     def parse_url(cls, string: str) -> dict[str, str]:
         """
@@ -173,7 +336,9 @@ class CourseLocator(BlockLocatorBase, CourseKey):
     CHECKED_INIT = False
 
     # Characters that are forbidden in the deprecated format
-    INVALID_CHARS_DEPRECATED = re.compile(r"[^\w.%-]", re.UNICODE)
+    INVALID_CHARS_DEPRECATED = _DEPRECATED_INVALID_CHARS
+    # A non-empty deprecated-format field, i.e. one with no INVALID_CHARS_DEPRECATED
+    DEPRECATED_ID_RE = re.compile(r"^[\w.%-]+\Z", re.UNICODE)
 
     def __init__(
         self,
@@ -203,36 +368,46 @@ class CourseLocator(BlockLocatorBase, CourseKey):
             course, __, run = offering_arg.partition("/")
 
         if deprecated:
-            for part in (org, course, run):
-                self._check_location_part(part, self.INVALID_CHARS_DEPRECATED)
-
-            fields: list[str] = [org, course]  # type: ignore
-            # Deprecated style allowed to have None for run and branch, and allowed to have '' for run
-            if run:
-                fields.append(run)
-            if branch is not None:
-                fields.append(branch)
-            if not all(self.DEPRECATED_ALLOWED_ID_RE.match(field) for field in fields):
-                raise InvalidKeyError(self.__class__, fields)
-
+            self._check_deprecated_fields(org, course, run, branch)
         else:
             if version_guid:
                 version_guid = self.as_object_id(version_guid)
 
-            for name, value in [['org', org], ['course', course], ['run', run], ['branch', branch]]:
-                if not (value is None or self.ALLOWED_ID_RE.match(value)):
-                    raise InvalidKeyError(self.__class__,
-                                          f"Special characters not allowed in field {name}: '{value}'")
-
-        super().__init__(
-            org=org,
-            course=course,
-            run=run,
-            branch=branch,
-            version_guid=version_guid,
-            deprecated=deprecated,
-            **kwargs
-        )
+            allowed_id_re = self.ALLOWED_ID_RE
+            if org is not None and not _is_valid_id(allowed_id_re, None, org):
+                raise self._invalid_field_error('org', org)
+            if course is not None and not _is_valid_id(allowed_id_re, None, course):
+                raise self._invalid_field_error('course', course)
+            if run is not None and not _is_valid_id(allowed_id_re, None, run):
+                raise self._invalid_field_error('run', run)
+            if branch is not None and not _is_valid_id(allowed_id_re, None, branch):
+                raise self._invalid_field_error('branch', branch)
+
+        # Nearly all keys are on one of a few branches, so let them share the strings
+        if branch in _INTERNED_BRANCHES:
+            branch = sys.intern(str(branch))
+
+        if kwargs:
+            super().__init__(
+                org=org,
+                course=course,
+                run=run,
+                branch=branch,
+                version_guid=version_guid,
+                deprecated=deprecated,
+                **kwargs
+            )
+        else:
+            # The common case: store the fields directly rather than through OpaqueKey.__init__'s
+            # kwargs and the immutability check in OpaqueKey.__setattr__
+            set_slot = object.__setattr__
+            set_slot(self, 'deprecated', deprecated)
+            set_slot(self, 'org', org)
+            set_slot(self, 'course', course)
+            set_slot(self, 'run', run)
+            set_slot(self, 'branch', branch)
+            set_slot(self, 'version_guid', version_guid)
+            set_slot(self, '_initialized', True)
 
         if self.deprecated and (self.org is None or self.course is None):
             raise InvalidKeyError(self.__class__, "Deprecated strings must set both org and course.")
@@ -241,13 +416,41 @@ class CourseLocator(BlockLocatorBase, CourseKey):
                 (self.org is None or self.course is None or self.run is None):
             raise InvalidKeyError(self.__class__, "Either version_guid or org, course, and run should be set")
 
+    @classmethod
+    def _check_deprecated_fields(cls, org: Any, course: Any, run: Any, branch: Any) -> None:
+        """
+        Raise InvalidKeyError unless the fields of a deprecated (org/course/run) key are valid.
+        """
+        # Deprecated style allowed to have None for run and branch, and allowed to have '' for run
+        deprecated_id_re = cls.DEPRECATED_ID_RE
+        if org is not None:
+            if not isinstance(org, str):
+                raise InvalidKeyError(cls, f"{org!r} is not a string")
+            if not _is_valid_id(deprecated_id_re, None, org):
+                raise InvalidKeyError(cls, f"Invalid characters in field org: {org!r}")
+        if course is not None:
+            if not isinstance(course, str):
+                raise InvalidKeyError(cls, f"{course!r} is not a string")
+            if not _is_valid_id(deprecated_id_re, None, course):
+                raise InvalidKeyError(cls, f"Invalid characters in field course: {course!r}")
+        if run is not None:
+            if not isinstance(run, str):
+                raise InvalidKeyError(cls, f"{run!r} is not a string")
+            if run != '' and not _is_valid_id(deprecated_id_re, None, run):
+                raise InvalidKeyError(cls, f"Invalid characters in field run: {run!r}")
+        if branch is not None and not _is_valid_id(cls.DEPRECATED_ALLOWED_ID_RE, None, branch):
+            raise InvalidKeyError(cls, f"Invalid characters in field branch: {branch!r}")
+
     @classmethod
     def _check_location_part(cls, val, regexp):  # pylint: disable=missing-function-docstring
         if val is None:
             return
-        if not isinstance(val, str):
-            raise InvalidKeyError(cls, f"{val!r} is not a string")
-        if regexp.search(val) is not None:
+        # A str pattern only accepts str values, so a non-string shows up as a TypeError from the search
+        try:
+            invalid = regexp.search(val)
+        except TypeError as error:
+            raise InvalidKeyError(cls, f"{val!r} is not a string") from error
+        if invalid is not None:
             raise InvalidKeyError(cls, f"Invalid characters in {val!r}.")
 
     @property
@@ -281,17 +484,45 @@ class CourseLocator(BlockLocatorBase, CourseKey):
         return "/".join([self.course, self.run])
 
     @classmethod
+    @functools.lru_cache(maxsize=FROM_STRING_CACHE_SIZE)
     def _from_string(cls, serialized):
         """
         Return a CourseLocator parsing the given serialized string
         :param serialized: matches the string to a CourseLocator
         """
-        parse = cls.parse_url(serialized)
+        return cls._from_parsed(cls.parse_url(serialized))
 
-        if parse['version_guid']:
-            parse['version_guid'] = cls.as_object_id(parse['version_guid'])
+    @classmethod
+    def _from_parsed(cls, parse):
+        """
+        Return a CourseLocator built from the groups that `parse_url` extracted from a serialized string
 
-        return cls(**{key: parse.get(key) for key in cls.KEY_FIELDS})
+        URL_RE has already matched each of these fields against ALLOWED_ID_CHARS, so unlike `__init__`,
+        this doesn't check them again.
+        """
+        org, course, run, branch = parse['org'], parse['course'], parse['run'], parse['branch']
+        version_guid = parse['version_guid']
+        if version_guid:
+            version_guid = cls.as_object_id(version_guid)
+        if cls.__init__ is not CourseLocator.__init__:
+            # Subclasses may check more in their own __init__
+            return cls(org, course, run, branch, version_guid)
+
+        if version_guid is None and (org is None or course is None or run is None):
+            raise InvalidKeyError(cls, "Either version_guid or org, course, and run should be set")
+        if branch in _INTERNED_BRANCHES:
+            branch = sys.intern(branch)
+
+        key = object.__new__(cls)
+        set_slot = object.__setattr__
+        set_slot(key, 'deprecated', False)
+        set_slot(key, 'org', org)
+        set_slot(key, 'course', course)
+        set_slot(key, 'run', run)
+        set_slot(key, 'branch', branch)
+        set_slot(key, 'version_guid', version_guid)
+        set_slot(key, '_initialized', True)
+        return key
 
     def html_id(self):
         """
@@ -339,6 +570,8 @@ class CourseLocator(BlockLocatorBase, CourseKey):
         Raises:
             ValueError: if the block locator has no org & course, run
         """
+        if self.version_guid is None:
+            return self
         return self.replace(version_guid=None)
 
     def course_agnostic(self) -> Self:
@@ -357,6 +590,8 @@ class CourseLocator(BlockLocatorBase, CourseKey):
         """
         if self.org is None:
             raise InvalidKeyError(self.__class__, "Branches must have full course ids not just versions")
+        if branch == self.branch and self.version_guid is None:
+            return self
         return self.replace(branch=branch, version_guid=None)
 
     def for_version(self, version_guid: str) -> Self:
@@ -366,19 +601,22 @@ class CourseLocator(BlockLocatorBase, CourseKey):
         """
         return self.replace(version_guid=version_guid)
 
+    @_cache_serialization
     def _to_string(self) -> str:
         """
         Return a string representing this location.
         """
-        parts: list[str] = []
+        version_guid = self.version_guid
         if self.course and self.run:
-            parts.extend([self.org, self.course, self.run])  # type: ignore
+            serialized = "+".join([self.org, self.course, self.run])  # type: ignore
             if self.branch:
-                parts.append(f"{self.BRANCH_PREFIX}@{self.branch}")
-        if self.version_guid:
-            parts.append(f"{self.VERSION_PREFIX}@{self.version_guid}")
-        return "+".join(parts)
+                serialized = f"{serialized}+{self.BRANCH_PREFIX}@{self.branch}"
+            if version_guid:
+                serialized = f"{serialized}+{self.VERSION_PREFIX}@{version_guid}"
+            return serialized
+        return f"{self.VERSION_PREFIX}@{version_guid}" if version_guid else ""
 
+    @_cache_deprecated_serialization
     def _to_deprecated_string(self) -> str:
         """Returns an 'old-style' course id, represented as 'org/course/run'"""
         return '/'.join([self.org, self.course, self.run])  # type: ignore
@@ -400,10 +638,11 @@ class CourseLocator(BlockLocatorBase, CourseKey):
             InvalidKeyError: Should be raised if `serialized` is not a valid serialized key
                 understood by `cls`.
         """
-        if serialized.count('/') != 2:
+        parts = serialized.split('/')
+        if len(parts) != 3:
             raise InvalidKeyError(cls, serialized)
 
-        return cls(*serialized.split('/'), deprecated=True)  # type: ignore
+        return cls(*parts, deprecated=True)  # type: ignore
 
 
 CourseKey.set_deprecated_fallback(CourseLocator)
@@ -459,7 +698,6 @@ class LibraryLocator(BlockLocatorBase, CourseKey):
         """
         if 'offering' in kwargs:
             raise ValueError("'offering' is not a valid field for a LibraryLocator.")
-
         if 'course' in kwargs:
             if library is not None:
                 raise ValueError("Cannot specify both 'library' and 'course'")
@@ -477,10 +715,15 @@ class LibraryLocator(BlockLocatorBase, CourseKey):
         if version_guid:
             version_guid = self.as_object_id(version_guid)  # type: ignore
 
-        for name, value in [['org', org], ['library', library], ['branch', branch]]:
-            if not (value is None or self.ALLOWED_ID_RE.match(value)):
-                raise InvalidKeyError(self.__class__,
-                                      f"Special characters not allowed in field {name}: '{value}'")
+        allowed_id_re = self.ALLOWED_ID_RE
+        if org is not None and not _is_valid_id(allowed_id_re, None, org):
+            raise self._invalid_field_error('org', org)
+        if library is not None and not _is_valid_id(allowed_id_re, None, library):
+            raise self._invalid_field_error('library', library)
+        if branch is not None and not _is_valid_id(allowed_id_re, None, branch):
+            raise self._invalid_field_error('branch', branch)
+        if branch in _INTERNED_BRANCHES:
+            branch = sys.intern(str(branch))
 
         if kwargs.get('deprecated', False):
             raise InvalidKeyError(self.__class__, 'LibraryLocator cannot have deprecated=True')
@@ -526,22 +769,46 @@ class LibraryLocator(BlockLocatorBase, CourseKey):
         return self.version_guid
 
     @classmethod
+    @functools.lru_cache(maxsize=FROM_STRING_CACHE_SIZE)
     def _from_string(cls, serialized):
         """
         Return a LibraryLocator parsing the given serialized string
         :param serialized: matches the string to a LibraryLocator
         """
-        parse = cls.parse_url(serialized)
+        return cls._from_parsed(cls.parse_url(serialized))
+
+    @classmethod
+    def _from_parsed(cls, parse):
+        """
+        Return a LibraryLocator built from the groups that `parse_url` extracted from a serialized string
 
+        As in CourseLocator, the fields have already been matched against ALLOWED_ID_CHARS, so they aren't
+        checked again.
+        """
         # The regex detects the "library" key part as "course"
         # since we're sharing a regex with CourseLocator
-        parse["library"] = parse["course"]
-        del parse["course"]
-
-        if parse['version_guid']:
-            parse['version_guid'] = cls.as_object_id(parse['version_guid'])
-
-        return cls(**{key: parse.get(key) for key in cls.KEY_FIELDS})
+        org, library, branch = parse['org'], parse['course'], parse['branch']
+        version_guid = parse['version_guid']
+        if version_guid:
+            version_guid = cls.as_object_id(version_guid)
+        if cls.__init__ is not LibraryLocator.__init__:
+            # Subclasses may check more in their own __init__
+            return cls(org, library, branch, version_guid)
+
+        if version_guid is None and (org is None or library is None):
+            raise InvalidKeyError(cls, "Either version_guid or org and library should be set")
+        if branch in _INTERNED_BRANCHES:
+            branch = sys.intern(branch)
+
+        key = object.__new__(cls)
+        set_slot = object.__setattr__
+        set_slot(key, 'deprecated', False)
+        set_slot(key, 'org', org)
+        set_slot(key, 'library', library)
+        set_slot(key, 'branch', branch)
+        set_slot(key, 'version_guid', version_guid)
+        set_slot(key, '_initialized', True)
+        return key
 
     def html_id(self):
         """
@@ -568,6 +835,8 @@ class LibraryLocator(BlockLocatorBase, CourseKey):
         Raises:
             ValueError: if the block locator has no org & course, run
         """
+        if self.version_guid is None:
+            return self
         return self.replace(version_guid=None)
 
     def course_agnostic(self):
@@ -586,6 +855,8 @@ class LibraryLocator(BlockLocatorBase, CourseKey):
         """
         if self.org is None and branch is not None:
             raise InvalidKeyError(self.__class__, "Branches must have full library ids not just versions")
+        if branch == self.branch and self.version_guid is None:
+            return self
         return self.replace(branch=branch, version_guid=None)
 
     def for_version(self, version_guid):
@@ -595,18 +866,20 @@ class LibraryLocator(BlockLocatorBase, CourseKey):
         """
         return self.replace(version_guid=version_guid)
 
+    @_cache_serialization
     def _to_string(self):
         """
         Return a string representing this location.
         """
-        parts = []
+        version_guid = self.version_guid
         if self.library:
-            parts.extend([self.org, self.library])
+            serialized = "+".join([self.org, self.library])
             if self.branch:
-                parts.append(f"{self.BRANCH_PREFIX}@{self.branch}")
-        if self.version_guid:
-            parts.append(f"{self.VERSION_PREFIX}@{self.version_guid}")
-        return "+".join(parts)
+                serialized = f"{serialized}+{self.BRANCH_PREFIX}@{self.branch}"
+            if version_guid:
+                serialized = f"{serialized}+{self.VERSION_PREFIX}@{version_guid}"
+            return serialized
+        return f"{self.VERSION_PREFIX}@{version_guid}" if version_guid else ""
 
     def _to_deprecated_string(self):
         """ LibraryLocators are never deprecated. """
@@ -654,45 +927,68 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
     course_key: CourseLocator
     block_type: str
     block_id: str
+    __slots__ = KEY_FIELDS
 
     DEPRECATED_URL_RE = re.compile("""
         i4x://
-        (?P<org>[^/]+)/
-        (?P<course>[^/]+)/
-        (?P<category>[^/]+)/     # category == block_type
-        (?P<name>[^@]+)          # name == block_id
-        (@(?P<revision>[^/]+))?  # branch == revision
+        (?P<org>[^/]++)/
+        (?P<course>[^/]++)/
+        (?P<category>[^/]++)/     # category == block_type
+        (?P<name>[^@]++)          # name == block_id
+        (@(?P<revision>[^/]++))?  # branch == revision
         \\Z
     """, re.VERBOSE)
 
     # TODO (cpennington): We should decide whether we want to expand the
     # list of valid characters in a location
-    DEPRECATED_INVALID_CHARS = re.compile(r"[^\w.%-]", re.UNICODE)
+    DEPRECATED_INVALID_CHARS = _DEPRECATED_INVALID_CHARS
     # Names are allowed to have colons.
-    DEPRECATED_INVALID_CHARS_NAME = re.compile(r"[^\w.:%-]", re.UNICODE)
+    DEPRECATED_INVALID_CHARS_NAME = _DEPRECATED_INVALID_CHARS_NAME
 
     # html ids can contain word chars and dashes
-    DEPRECATED_INVALID_HTML_CHARS = re.compile(r"[^\w-]", re.UNICODE)
+    DEPRECATED_INVALID_HTML_CHARS = _DEPRECATED_INVALID_HTML_CHARS
+
+    # Fields that `replace` routes to `course_key` or maps from their deprecated names
+    _COURSE_KEY_FIELDS = frozenset(CourseLocator.KEY_FIELDS)
+    _REPLACE_REWRITTEN_FIELDS = _COURSE_KEY_FIELDS | {'revision', 'version', 'name', 'category'}
 
     def __init__(self, course_key, block_type, block_id, **kwargs):
         """
         Construct a BlockUsageLocator
         """
         # Always use the deprecated status of the course key
-        deprecated = kwargs['deprecated'] = course_key.deprecated
-        block_id = self._parse_block_ref(block_id, deprecated)
+        deprecated = course_key.deprecated
+        kwargs.pop('deprecated', None)
+        # Plain ASCII ids that are valid in either format don't need the full `_parse_block_ref` checks
+        if not (isinstance(block_id, str) and _is_plain_ascii_id(block_id)):
+            block_id = self._parse_block_ref(block_id, deprecated)
         if block_id is None and not deprecated:
             raise InvalidKeyError(self.__class__, "Missing block id")
+        # A few block types are shared by nearly all usages, so let them share the strings too
+        if isinstance(block_type, str) and block_type in _INTERNED_BLOCK_TYPES:
+            block_type = sys.intern(str(block_type))
 
-        super().__init__(course_key=course_key, block_type=block_type, block_id=block_id, **kwargs)
+        if kwargs:
+            super().__init__(
+                course_key=course_key, block_type=block_type, block_id=block_id, deprecated=deprecated, **kwargs
+            )
+        else:
+            # As in CourseLocator, store the fields directly in the common case
+            set_slot = object.__setattr__
+            set_slot(self, 'deprecated', deprecated)
+            set_slot(self, 'course_key', course_key)
+            set_slot(self, 'block_type', block_type)
+            set_slot(self, 'block_id', block_id)
+            set_slot(self, '_initialized', True)
 
     def replace(self, **kwargs) -> Self:
+        # Most callers only replace this key's own fields, so skip the rewriting below entirely.
+        if self._REPLACE_REWRITTEN_FIELDS.isdisjoint(kwargs):
+            return super().replace(**kwargs)
+
         # BlockUsageLocator allows for the replacement of 'KEY_FIELDS' in 'self.course_key'.
         # This includes the deprecated 'KEY_FIELDS' of CourseLocator `'revision'` and `'version'`.
-        course_key_kwargs = {}
-        for key in CourseLocator.KEY_FIELDS:
-            if key in kwargs:
-                course_key_kwargs[key] = kwargs.pop(key)
+        course_key_kwargs = {key: kwargs.pop(key) for key in self._COURSE_KEY_FIELDS & kwargs.keys()}
         if 'revision' in kwargs and 'branch' not in course_key_kwargs:
             course_key_kwargs['branch'] = kwargs.pop('revision')
         if 'version' in kwargs and 'version_guid' not in course_key_kwargs:
@@ -715,7 +1011,12 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
 
         invalid should be a compiled regexp of chars to replace with '_'
         """
-        return re.sub('_+', '_', invalid.sub('_', value))
+        table = _DEPRECATED_INVALID_ASCII_TABLES.get(invalid)
+        if table is not None and value.isascii():
+            # Byte-wise translation is much cheaper than a regex substitution for the usual ASCII ids
+            value = value.encode('ascii').translate(table).decode('ascii')
+            return _UNDERSCORE_RUNS.sub('_', value) if '__' in value else value
+        return _UNDERSCORE_RUNS.sub('_', invalid.sub('_', value))
 
     @classmethod
     def clean(cls, value: str) -> str:
@@ -757,13 +1058,17 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
         return cls._clean(value, cls.DEPRECATED_INVALID_HTML_CHARS)
 
     @classmethod
+    @functools.lru_cache(maxsize=FROM_STRING_CACHE_SIZE)
     def _from_string(cls, serialized: str) -> Self:
         """
         Requests CourseLocator to deserialize its part and then adds the local deserialization of block
         """
-        # Allow access to _from_string protected method
-        course_key = CourseLocator._from_string(serialized)
+        # Every usage string has a block part following the course part; reject others before parsing
+        if f"+{cls.BLOCK_PREFIX}@" not in serialized:
+            raise InvalidKeyError(cls, serialized)
         parsed_parts = cls.parse_url(serialized)
+        # The course part is built from the same parse, rather than having CourseLocator parse it again
+        course_key = CourseLocator._from_parsed(parsed_parts)
         block_id = parsed_parts.get('block_id', None)
         if block_id is None:
             raise InvalidKeyError(cls, serialized)
@@ -778,7 +1083,7 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
         Raises:
             ValueError: if the block locator has no org, course, and run
         """
-        return self.replace(course_key=self.course_key.version_agnostic())
+        return self._with_course_key(self.course_key.version_agnostic())
 
     def course_agnostic(self) -> Self:
         """
@@ -788,19 +1093,19 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
         Raises:
             ValueError if the block locator has no version_guid
         """
-        return self.replace(course_key=self.course_key.course_agnostic())
+        return self._with_course_key(self.course_key.course_agnostic())
 
     def for_branch(self, branch):
         """
         Return a UsageLocator for the same block in a different branch of the course.
         """
-        return self.replace(course_key=self.course_key.for_branch(branch))
+        return self._with_course_key(self.course_key.for_branch(branch))
 
     def for_version(self, version_guid):
         """
         Return a UsageLocator for the same block in a different branch of the course.
         """
-        return self.replace(course_key=self.course_key.for_version(version_guid))
+        return self._with_course_key(self.course_key.for_version(version_guid))
 
     @classmethod
     def _parse_block_ref(cls, block_ref, deprecated=False):
@@ -819,14 +1124,9 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
         if isinstance(block_ref, LocalId):
             return block_ref
 
-        is_valid_deprecated = deprecated and cls.DEPRECATED_ALLOWED_ID_RE.match(block_ref)
-        is_valid = cls.ALLOWED_ID_RE.match(block_ref)
-
-        # pylint: disable=no-else-return
-        if is_valid or is_valid_deprecated:
+        if _is_valid_id(cls.ALLOWED_ID_RE, cls.DEPRECATED_ALLOWED_ID_RE if deprecated else None, block_ref):
             return block_ref
-        else:
-            raise InvalidKeyError(cls, block_ref)
+        raise InvalidKeyError(cls, block_ref)
 
     @property
     def definition_key(self):  # pragma: no cover
@@ -862,12 +1162,12 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
             stacklevel=2
         )
 
-        # pylint: disable=no-else-return
-        if not self.course and not self.run:
+        course, run = self.course_key.course, self.course_key.run
+        if not course and not run:
             return None
-        elif not self.run and self.course:
-            return self.course
-        return "/".join([self.course, self.run])
+        if not run and course:
+            return course
+        return "/".join([course, run])
 
     @property
     def branch(self):
@@ -931,7 +1231,7 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
             DeprecationWarning,
             stacklevel=2
         )
-        return self.branch
+        return self.course_key.branch
 
     def is_fully_specified(self):
         """Returns boolean; whether or not this object's course_key is fully specified."""
@@ -955,8 +1255,31 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
         Return a new instance which has the this block_id in the given course
         :param course_key: a CourseKey object representing the new course to map into
         """
-        return self.replace(course_key=course_key)
+        return self._with_course_key(course_key)
+
+    def _with_course_key(self, course_key):
+        """
+        Return this block in `course_key`, or self if that is already this block's course key.
+
+        The course key transformations (`version_agnostic` etc.) return their key unchanged when there
+        is nothing to change, so the identity check avoids comparing the keys for them. When they do change,
+        this block's fields are copied over without being validated again.
+        """
+        if course_key is self.course_key or course_key == self.course_key:
+            return self
+        if course_key.deprecated != self.deprecated or type(self) not in _COPYABLE_USAGE_TYPES:
+            return self.replace(course_key=course_key)
+        # block_type and block_id have already passed this format's checks, so copy them as they are
+        copy = object.__new__(type(self))
+        set_slot = object.__setattr__
+        set_slot(copy, 'deprecated', self.deprecated)
+        set_slot(copy, self.KEY_FIELDS[0], course_key)
+        set_slot(copy, 'block_type', self.block_type)
+        set_slot(copy, 'block_id', self.block_id)
+        set_slot(copy, '_initialized', True)
+        return copy
 
+    @_cache_serialization
     def _to_string(self):
         """
         Return a string representing this location.
@@ -978,23 +1301,26 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
         (e.g., I'm assuming periods are fine).
         """
         if self.deprecated:
-            id_fields = [self.DEPRECATED_TAG, self.org, self.course, self.block_type, self.block_id, self.version_guid]
-            id_string = "-".join([v for v in id_fields if v is not None])
-            return self.clean_for_html(id_string)
+            course_key = self.course_key
+            id_fields = (
+                self.DEPRECATED_TAG, course_key.org, course_key.course, self.block_type, self.block_id,
+                course_key.version_guid,
+            )
+            return self.clean_for_html("-".join([v for v in id_fields if v is not None]))
         return self.block_id
 
+    @_cache_deprecated_serialization
     def _to_deprecated_string(self):
         """
         Returns an old-style location, represented as:
         i4x://org/course/category/name[@revision]  # Revision is optional
         """
-        url = (
-            f"{self.DEPRECATED_TAG}://{self.course_key.org}/{self.course_key.course}"
-            f"/{self.block_type}/{self.block_id}"
+        course_key = self.course_key
+        revision = f"@{course_key.branch}" if course_key.branch else ""
+        return (
+            f"{self.DEPRECATED_TAG}://{course_key.org}/{course_key.course}"
+            f"/{self.block_type}/{self.block_id}{revision}"
         )
-        if self.course_key.branch:
-            url += f"@{self.course_key.branch}"
-        return url
 
     @classmethod
     def _from_deprecated_string(cls, serialized):
@@ -1013,18 +1339,13 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
             InvalidKeyError: Should be raised if `serialized` is not a valid serialized key
                 understood by `cls`.
         """
-        match = cls.DEPRECATED_URL_RE.match(serialized)
-        if match is None:
+        if not serialized.startswith('i4x://'):
             raise InvalidKeyError(BlockUsageLocator, serialized)
-        groups = match.groupdict()
-        course_key = CourseLocator(
-            org=groups['org'],
-            course=groups['course'],
-            run=None,
-            branch=groups.get('revision'),
-            deprecated=True,
-        )
-        return cls(course_key, groups['category'], groups['name'], deprecated=True)
+        groups = _parse_deprecated(cls.DEPRECATED_URL_RE, serialized)
+        if groups is None:
+            raise InvalidKeyError(BlockUsageLocator, serialized)
+        org, course, revision, category, name = groups
+        return cls(_deprecated_course_key(org, course, None, revision), category, name, deprecated=True)
 
     def to_deprecated_son(self, prefix='', tag='i4x'):
         """
@@ -1033,29 +1354,28 @@ class BlockUsageLocator(BlockLocatorBase, UsageKey):
         # This preserves the old SON keys ('tag', 'org', 'course', 'category', 'name', 'revision'),
         # because that format was used to store data historically in mongo
 
-        # adding tag b/c deprecated form used it
-        son = SON({prefix + 'tag': tag})
-        for field_name in ('org', 'course'):
-            # Temporary filtering of run field because deprecated form left it out
-            son[prefix + field_name] = getattr(self.course_key, field_name)
-        for (dep_field_name, field_name) in [('category', 'block_type'), ('name', 'block_id')]:
-            son[prefix + dep_field_name] = getattr(self, field_name)
-
-        son[prefix + 'revision'] = self.course_key.branch
-        return son
+        # adding tag b/c deprecated form used it; run is left out because the deprecated form did so too
+        course_key = self.course_key
+        return SON([
+            (prefix + 'tag', tag),
+            (prefix + 'org', course_key.org),
+            (prefix + 'course', course_key.course),
+            (prefix + 'category', self.block_type),
+            (prefix + 'name', self.block_id),
+            (prefix + 'revision', course_key.branch),
+        ])
 
     @classmethod
     def _from_deprecated_son(cls, id_dict, run):
         """
         Return the Location decoding this id_dict and run
         """
-        course_key = CourseLocator(
-            id_dict['org'],
-            id_dict['course'],
-            run,
-            id_dict['revision'],
-            deprecated=True,
-        )
+        org, course, revision = id_dict['org'], id_dict['course'], id_dict['revision']
+        if all(isinstance(field, (str, type(None))) for field in (org, course, run, revision)):
+            course_key = _deprecated_course_key(org, course, run, revision)
+        else:
+            # Only string fields can be memoized; CourseLocator will report the invalid ones
+            course_key = CourseLocator(org, course, run, revision, deprecated=True)
         return cls(course_key, id_dict['category'], id_dict['name'], deprecated=True)
 
 
@@ -1070,42 +1390,58 @@ class LibraryUsageLocator(BlockUsageLocator):
     """
     CANONICAL_NAMESPACE = 'lib-block-v1'
     KEY_FIELDS = ('library_key', 'block_type', 'block_id')
+    # block_type and block_id use the slots inherited from BlockUsageLocator
+    __slots__ = ('library_key',)
 
     library_key: LibraryLocator
     block_type: str
 
+    # Fields that `replace` routes to `library_key` or maps from their deprecated names
+    _LIBRARY_KEY_FIELDS = frozenset(LibraryLocator.KEY_FIELDS)
+    _LIBRARY_REPLACE_FIELDS = _LIBRARY_KEY_FIELDS | {'version', 'course_key'}
+
     def __init__(self, library_key: LibraryLocator, block_type: str, block_id: str, **kwargs):
         """
         Construct a LibraryUsageLocator
         """
         # LibraryUsageLocator is a new type of locator so should never be deprecated.
-        if library_key.deprecated or kwargs.get('deprecated', False):
+        if library_key.deprecated or kwargs.pop('deprecated', False):
             raise InvalidKeyError(self.__class__, "LibraryUsageLocators are never deprecated.")
 
-        block_id = self._parse_block_ref(block_id, False)
+        # As in BlockUsageLocator, plain ASCII ids don't need the full `_parse_block_ref` checks
+        if not (isinstance(block_id, str) and _is_plain_ascii_id(block_id)):
+            block_id = self._parse_block_ref(block_id, False)
 
-        try:
-            if not all(self.ALLOWED_ID_RE.match(val) for val in (block_type, block_id)):
-                raise InvalidKeyError(
-                    self.__class__,
-                    f"Invalid block_type or block_id ({block_type!r}, {block_id!r})"
-                )
-        except TypeError as error:
+        # Any str block_id has been validated by now; LocalIds aren't allowed in libraries.
+        if not (
+            isinstance(block_type, str) and isinstance(block_id, str) and
+            (_is_plain_ascii_id(block_type) or _is_valid_id(self.ALLOWED_ID_RE, None, block_type))
+        ):
             raise InvalidKeyError(
                 self.__class__,
                 f"Invalid block_type or block_id ({block_type!r}, {block_id!r})"
-            ) from error
+            )
+        if block_type in _INTERNED_BLOCK_TYPES:
+            block_type = sys.intern(str(block_type))
 
-        # We skip the BlockUsageLocator init and go to its superclass:
-        super(BlockUsageLocator, self).__init__(library_key=library_key, block_type=block_type, block_id=block_id,
-                                                **kwargs)
+        if kwargs:
+            # We skip the BlockUsageLocator init and go to its superclass:
+            super(BlockUsageLocator, self).__init__(library_key=library_key, block_type=block_type, block_id=block_id,
+                                                    **kwargs)
+        else:
+            # As in BlockUsageLocator, store the fields directly in the common case
+            set_slot = object.__setattr__
+            set_slot(self, 'deprecated', False)
+            set_slot(self, 'library_key', library_key)
+            set_slot(self, 'block_type', block_type)
+            set_slot(self, 'block_id', block_id)
+            set_slot(self, '_initialized', True)
 
     def replace(self, **kwargs):
+        if self._LIBRARY_REPLACE_FIELDS.isdisjoint(kwargs):
+            return super().replace(**kwargs)
         # BlockUsageLocator allows for the replacement of 'KEY_FIELDS' in 'self.library_key'
-        lib_key_kwargs = {}
-        for key in LibraryLocator.KEY_FIELDS:
-            if key in kwargs:
-                lib_key_kwargs[key] = kwargs.pop(key)
+        lib_key_kwargs = {key: kwargs.pop(key) for key in self._LIBRARY_KEY_FIELDS & kwargs.keys()}
         if 'version' in kwargs and 'version_guid' not in lib_key_kwargs:
             lib_key_kwargs['version_guid'] = kwargs.pop('version')
         if lib_key_kwargs:
@@ -1115,13 +1451,14 @@ class LibraryUsageLocator(BlockUsageLocator):
         return super().replace(**kwargs)
 
     @classmethod
+    @functools.lru_cache(maxsize=FROM_STRING_CACHE_SIZE)
     def _from_string(cls, serialized):
         """
         Requests LibraryLocator to deserialize its part and then adds the local deserialization of block
         """
-        # Allow access to _from_string protected method
-        library_key = LibraryLocator._from_string(serialized)  # pylint: disable=protected-access
         parsed_parts = LibraryLocator.parse_url(serialized)
+        # The library part is built from the same parse, rather than having LibraryLocator parse it again
+        library_key = LibraryLocator._from_parsed(parsed_parts)  # pylint: disable=protected-access
 
         block_id = parsed_parts.get('block_id', None)
         if block_id is None:
@@ -1142,19 +1479,19 @@ class LibraryUsageLocator(BlockUsageLocator):
         Raises:
             ValueError: if the block locator has no org, course, and run
         """
-        return self.replace(library_key=self.library_key.version_agnostic())
+        return self._with_course_key(self.library_key.version_agnostic())
 
     def for_branch(self, branch):
         """
         Return a UsageLocator for the same block in a different branch of the library.
         """
-        return self.replace(library_key=self.library_key.for_branch(branch))
+        return self._with_course_key(self.library_key.for_branch(branch))
 
     def for_version(self, version_guid):
         """
         Return a UsageLocator for the same block in a different version of the library.
         """
-        return self.replace(library_key=self.library_key.for_version(version_guid))
+        return self._with_course_key(self.library_key.for_version(version_guid))
 
     @property
     def course_key(self):
@@ -1200,6 +1537,7 @@ class DefinitionLocator(Locator, DefinitionKey):
     CANONICAL_NAMESPACE = 'def-v1'
     KEY_FIELDS = ('definition_id', 'block_type')
     CHECKED_INIT = False
+    __slots__ = KEY_FIELDS
 
     # override the abstractproperty
     block_type: str
@@ -1221,8 +1559,8 @@ class DefinitionLocator(Locator, DefinitionKey):
         return f"{self.definition_id!s}+{self.BLOCK_TYPE_PREFIX}@{self.block_type}"
 
     URL_RE = re.compile(
-        fr"^(?P<definition_id>[a-f0-9]+)\+{Locator.BLOCK_TYPE_PREFIX}"
-        fr"@(?P<block_type>{Locator.ALLOWED_ID_CHARS}+)\Z",
+        fr"^(?P<definition_id>[a-f0-9]++)\+{Locator.BLOCK_TYPE_PREFIX}"
+        fr"@(?P<block_type>{Locator.ALLOWED_ID_CHARS}++)\Z",
         re.VERBOSE | re.UNICODE
     )
 
@@ -1236,11 +1574,8 @@ class DefinitionLocator(Locator, DefinitionKey):
         if not parse:
             raise InvalidKeyError(cls, serialized)
 
-        data = parse.groupdict()
-        if data['definition_id']:
-            data['definition_id'] = cls.as_object_id(data['definition_id'])
-
-        return cls(**{key: data.get(key) for key in cls.KEY_FIELDS})  # type: ignore
+        # URL_RE only matches non-empty hex definition ids
+        return cls(parse['block_type'], cls.as_object_id(parse['definition_id']))
 
     @property
     def version(self) -> ObjectId:
@@ -1254,21 +1589,53 @@ class VersionTree:
     """
     Holds trees of Locators to represent version histories.
     """
+    __slots__ = ('locator', 'children')
+
     def __init__(self, locator, tree_dict=None):
         """
         :param locator: must be version specific (Course has version_guid or definition had id)
         """
+        version = self._version_of(locator)
+        self.locator = locator
+        self.children = []
+        if tree_dict is None:
+            return
+
+        # Build the subtrees depth-first with an explicit stack rather than recursively, so that long histories
+        # can't hit the recursion limit. A version may be derived from several others (e.g. by a merge), but not
+        # from itself.
+        ancestors = {version}
+        stack = [(self, version, iter(tree_dict.get(version, [])))]
+        while stack:
+            tree, version, children = stack[-1]
+            for child in children:
+                child_version = self._version_of(child)
+                if child_version in ancestors:
+                    raise ValueError(f"version {child_version} is derived from itself in the version history")
+                # The child has just been checked, so don't let VersionTree.__init__ check it again
+                subtree = VersionTree.__new__(VersionTree)
+                subtree.locator = child
+                subtree.children = []
+                tree.children.append(subtree)
+                ancestors.add(child_version)
+                stack.append((subtree, child_version, iter(tree_dict.get(child_version, []))))
+                break
+            else:
+                stack.pop()
+                ancestors.discard(version)
+
+    @staticmethod
+    def _version_of(locator):
+        """
+        Return the version that `locator` refers to, raising an error if it isn't a version specific Locator.
+        """
         if not isinstance(locator, Locator) and not inspect.isabstract(locator):
             raise TypeError(f"locator {locator} must be a concrete subclass of Locator")
         version = ((hasattr(locator, 'version_guid') and locator.version_guid) or
                    (hasattr(locator, 'definition_id') and locator.definition_id))
         if not version:
             raise ValueError("locator must be version specific (Course has version_guid or definition had id)")
-        self.locator = locator
-        if tree_dict is None:
-            self.children = []
-        else:
-            self.children = [VersionTree(child, tree_dict) for child in tree_dict.get(version, [])]
+        return version
 
 
 class AssetLocator(BlockUsageLocator, AssetKey):    # pylint: disable=abstract-method
@@ -1277,16 +1644,16 @@ class AssetLocator(BlockUsageLocator, AssetKey):    # pylint: disable=abstract-m
     """
     CANONICAL_NAMESPACE = 'asset-v1'
     DEPRECATED_TAG = 'c4x'
-    __slots__ = BlockUsageLocator.KEY_FIELDS
+    __slots__ = ()
 
     ASSET_URL_RE = re.compile(r"""
         ^
         /c4x/
-        (?P<org>[^/]+)/
-        (?P<course>[^/]+)/
-        (?P<category>[^/]+)/
-        (?P<name>[^@]+)
-        (@(?P<revision>[^/]+))?
+        (?P<org>[^/]++)/
+        (?P<course>[^/]++)/
+        (?P<category>[^/]++)/
+        (?P<name>[^@]++)
+        (@(?P<revision>[^/]++))?
         \Z
     """, re.VERBOSE)
 
@@ -1312,19 +1679,19 @@ class AssetLocator(BlockUsageLocator, AssetKey):    # pylint: disable=abstract-m
             kwargs['block_type'] = kwargs.pop('asset_type')
         return super().replace(**kwargs)
 
+    @_cache_deprecated_serialization
     def _to_deprecated_string(self):
         """
         Returns an old-style location, represented as:
 
         /c4x/org/course/category/name
         """
-        url = (
-            f"/{self.DEPRECATED_TAG}/{self.course_key.org}/{self.course_key.course}"
-            f"/{self.block_type}/{self.block_id}"
+        course_key = self.course_key
+        revision = f"@{course_key.branch}" if course_key.branch else ""
+        return (
+            f"/{self.DEPRECATED_TAG}/{course_key.org}/{course_key.course}"
+            f"/{self.block_type}/{self.block_id}{revision}"
         )
-        if self.course_key.branch:
-            url += f'@{self.course_key.branch}'
-        return url
 
     @property
     def tag(self):
@@ -1333,18 +1700,13 @@ class AssetLocator(BlockUsageLocator, AssetKey):    # pylint: disable=abstract-m
 
     @classmethod
     def _from_deprecated_string(cls, serialized):
-        match = cls.ASSET_URL_RE.match(serialized)
-        if match is None:
+        if not serialized.startswith('/c4x/'):
             raise InvalidKeyError(cls, serialized)
-        groups = match.groupdict()
-        course_key = CourseLocator(
-            groups['org'],
-            groups['course'],
-            None,
-            groups.get('revision', None),
-            deprecated=True
-        )
-        return cls(course_key, groups['category'], groups['name'], deprecated=True)
+        groups = _parse_deprecated(cls.ASSET_URL_RE, serialized)
+        if groups is None:
+            raise InvalidKeyError(cls, serialized)
+        org, course, revision, category, name = groups
+        return cls(_deprecated_course_key(org, course, None, revision), category, name, deprecated=True)
 
     def to_deprecated_list_repr(self):
         """
@@ -1352,12 +1714,17 @@ class AssetLocator(BlockUsageLocator, AssetKey):    # pylint: disable=abstract-m
         That should be the only use of this method, but the method is general enough to provide the pre-opaque
         Location fields as an array in the old order with the tag.
         """
-        return ['c4x', self.org, self.course, self.block_type, self.block_id, None]
+        course_key = self.course_key
+        return ['c4x', course_key.org, course_key.course, self.block_type, self.block_id, None]
 
 
 # Register AssetLocator as the deprecated fallback for AssetKey
 AssetKey.set_deprecated_fallback(AssetLocator)
 
+# Usage key types whose __init__ only validates block_type and block_id, which `_with_course_key` can skip.
+# (The deprecated classes in `locations` add their own checks.)
+_COPYABLE_USAGE_TYPES: frozenset[type] = frozenset((BlockUsageLocator, LibraryUsageLocator, AssetLocator))
+
 
 class BundleDefinitionLocator(CheckFieldMixin, DefinitionKey):
     """
@@ -1528,6 +1895,7 @@ class LibraryLocatorV2(CheckFieldMixin, LearningContextKey):
         return ":".join((self.org, self.slug))
 
     @classmethod
+    @functools.lru_cache(maxsize=FROM_STRING_CACHE_SIZE)
     def _from_string(cls, serialized: str) -> Self:
         """
         Instantiate this key from a serialized string
@@ -1600,6 +1968,7 @@ class LibraryUsageLocatorV2(CheckFieldMixin, UsageKeyV2):
         return ":".join((self.lib_key.org, self.lib_key.slug, self.block_type, self.usage_id))
 
     @classmethod
+    @functools.lru_cache(maxsize=FROM_STRING_CACHE_SIZE)
     def _from_string(cls, serialized: str) -> Self:
         """
         Instantiate this key from a serialized string
@@ -1666,6 +2035,7 @@ class LibraryCollectionLocator(CheckFieldMixin, LibraryCollectionKey):
         return ":".join((self.library_key.org, self.library_key.slug, self.collection_id))
 
     @classmethod
+    @functools.lru_cache(maxsize=FROM_STRING_CACHE_SIZE)
     def _from_string(cls, serialized: str) -> Self:
         """
         Instantiate this key from a serialized string
@@ -2,14 +2,22 @@
 Thorough tests of BlockUsageLocator, as well as UsageKeys generally
 """
 from itertools import product
+import pickle
+import warnings
 
 import ddt
 import itertools  # pylint: disable=wrong-import-order
 from bson.objectid import ObjectId
 
 from opaque_keys import InvalidKeyError
-from opaque_keys.edx.keys import UsageKey
-from opaque_keys.edx.locator import BlockUsageLocator, CourseLocator, LocalId
+from opaque_keys.edx.keys import CourseKey, UsageKey
+from opaque_keys.edx.locator import (
+    BlockUsageLocator,
+    CourseLocator,
+    LocalId,
+    _is_plain_ascii_id,
+    _parse_deprecated,
+)
 from opaque_keys.edx.tests import LocatorBaseTest
 
 # Pairs for testing the clean* functions.
@@ -186,6 +194,120 @@ class TestBlockUsageLocators(LocatorBaseTest):
         with self.assertRaises(AttributeError):
             setattr(loc, attr, attr)
 
+    def test_no_instance_dict(self):
+        loc = BlockUsageLocator(CourseLocator('org', 'course', 'run'), 'c', 'n')
+        self.assertFalse(hasattr(loc, '__dict__'))
+        self.assertFalse(hasattr(loc.course_key, '__dict__'))
+
+    def test_serialization_cached(self):
+        loc = UsageKey.from_string(BLOCK_URL)
+        self.assertEqual(str(loc), BLOCK_URL)
+        # pylint: disable=protected-access
+        self.assertIs(loc._to_string(), loc._to_string())
+        self.assertIs(loc.course_key._to_string(), loc.course_key._to_string())
+        # The cached serialization isn't part of the key's identity
+        self.assertEqual(loc, UsageKey.from_string(BLOCK_URL))
+        self.assertEqual(hash(loc), hash(UsageKey.from_string(BLOCK_URL)))
+
+        deprecated_url = 'i4x://org/course/category/name@revision'
+        deprecated_loc = UsageKey.from_string(deprecated_url)
+        self.assertEqual(str(deprecated_loc), deprecated_url)
+        self.assertIs(deprecated_loc._to_deprecated_string(), deprecated_loc._to_deprecated_string())
+        self.assertIs(str(deprecated_loc), str(deprecated_loc))
+
+        # Keys only keep the serialization that their __str__ uses
+        course_key = CourseLocator('org', 'course', 'run')
+        self.assertEqual(course_key._to_deprecated_string(), 'org/course/run')
+        self.assertEqual(course_key._to_string(), 'org+course+run')
+        self.assertEqual(course_key._to_deprecated_string(), 'org/course/run')
+
+    def test_hash_cached(self):
+        loc = UsageKey.from_string(BLOCK_URL)
+        # pylint: disable=protected-access
+        self.assertEqual(hash(loc), hash(loc._key))
+        self.assertEqual(loc._hash, hash(loc._key))
+        other = loc.replace(block_id='other')
+        self.assertNotEqual(loc, other)
+        self.assertEqual(other, BlockUsageLocator(loc.course_key, loc.block_type, 'other'))
+        self.assertEqual(hash(other), hash(BlockUsageLocator(loc.course_key, loc.block_type, 'other')))
+        self.assertEqual(pickle.loads(pickle.dumps(loc)), loc)
+        self.assertEqual(hash(pickle.loads(pickle.dumps(loc))), hash(loc))
+
+    @ddt.data('name', 'Name_1.2-3~4:5', '', ' name', 'name\n', 'na%me', 'na+me', 'na@me', 'na/me')
+    def test_plain_ascii_id(self, block_id):
+        self.assertEqual(_is_plain_ascii_id(block_id), bool(BlockUsageLocator.ALLOWED_ID_RE.match(block_id)))
+
+    def test_non_ascii_block_id(self):
+        loc = BlockUsageLocator(CourseLocator('org', 'course', 'run'), 'html', 'na\u00efve')
+        self.assertFalse(_is_plain_ascii_id(loc.block_id))
+        self.assertEqual(loc.block_id, 'na\u00efve')
+
+    def test_constructor_immutable(self):
+        course_key = CourseLocator('org', 'course', 'run')
+        loc = BlockUsageLocator(course_key, 'html', 'name', deprecated=True)
+        # The course key's deprecation status wins
+        self.assertFalse(loc.deprecated)
+        with self.assertRaises(AttributeError):
+            loc.block_id = 'other'  # type: ignore
+        self.assertEqual(loc, BlockUsageLocator(course_key, 'html', 'name'))
+
+    def test_block_type_interned(self):
+        first = UsageKey.from_string('block-v1:org+course+run+type@problem+block@first')
+        second = UsageKey.from_string('block-v1:org+course+run+type@problem+block@second')
+        self.assertIs(first.block_type, second.block_type)
+
+    def test_unknown_block_type_not_interned(self):
+        course_key = CourseLocator('org', 'course', 'run')
+        first = BlockUsageLocator(course_key, ''.join(['custom', '_block']), 'first')
+        second = BlockUsageLocator(course_key, ''.join(['custom', '_block']), 'second')
+        self.assertEqual(first.block_type, second.block_type)
+        self.assertIsNot(first.block_type, second.block_type)
+
+    def test_branch_interned(self):
+        first = UsageKey.from_string('block-v1:org+course+run+branch@draft+type@problem+block@first')
+        second = CourseLocator('org', 'other', 'run', ''.join(['dr', 'aft']))
+        self.assertIs(first.branch, second.branch)
+
+    def test_unknown_branch_not_interned(self):
+        first = CourseLocator('org', 'course', 'run', ''.join(['custom', '_branch']))
+        second = CourseLocator('org', 'other', 'run', ''.join(['custom', '_branch']))
+        self.assertEqual(first.branch, second.branch)
+        self.assertIsNot(first.branch, second.branch)
+
+    def test_from_string_cached(self):
+        self.assertIs(UsageKey.from_string(BLOCK_URL), UsageKey.from_string(BLOCK_URL))
+        course_url = 'course-v1:org+course+run'
+        self.assertIs(CourseKey.from_string(course_url), CourseKey.from_string(course_url))
+
+    def test_deprecated_parse_cached(self):
+        _parse_deprecated.cache_clear()
+        url = 'i4x://org/course/category/name@revision'
+        first = UsageKey.from_string(url)
+        second = UsageKey.from_string(url)
+        self.assertEqual(first, second)
+        self.assertEqual(str(second), url)
+        self.assertEqual(_parse_deprecated.cache_info().hits, 1)  # pylint: disable=no-value-for-parameter
+        with self.assertRaises(InvalidKeyError):
+            UsageKey.from_string('i4x://org/course')
+        with self.assertRaises(InvalidKeyError):
+            UsageKey.from_string('i4x://org/course')
+
+    def test_deprecated_properties_warn_per_call_site(self):
+        loc = BlockUsageLocator(CourseLocator('org', 'course', 'run'), 'category', 'name')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('default', DeprecationWarning)
+            for _ in range(3):
+                self.assertEqual(loc.name, 'name')
+                self.assertEqual(loc.category, 'category')
+        self.assertEqual(len(caught), 2)
+        self.assertEqual(caught[0].filename, __file__)
+        # Escalated warnings are raised on every access
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            for _ in range(2):
+                with self.assertRaises(DeprecationWarning):
+                    loc.name  # pylint: disable=pointless-statement
+
     @ddt.data(*product((True, False), repeat=2))
     @ddt.unpack
     def test_map_into_course_location(self, deprecated_source, deprecated_dest):
@@ -196,6 +318,30 @@ class TestBlockUsageLocators(LocatorBaseTest):
         actual = loc.map_into_course(new_course)
 
         self.assertEqual(expected, actual)
+        self.assertIs(loc.map_into_course(original_course), loc)
+        equal_course = CourseLocator('org', 'course', 'run', deprecated=deprecated_source)
+        self.assertIsNot(equal_course, original_course)
+        self.assertIs(loc.map_into_course(equal_course), loc)
+
+    def test_unchanged_course_key_transformations(self):
+        loc = BlockUsageLocator(CourseLocator('org', 'course', 'run', 'draft'), 'cat', 'name')
+        self.assertIs(loc.version_agnostic(), loc)
+        self.assertIs(loc.for_branch('draft'), loc)
+        self.assertEqual(loc.for_branch('published').branch, 'published')
+
+    def test_changed_course_key_transformations(self):
+        loc = BlockUsageLocator(CourseLocator('org', 'course', 'run', 'draft'), 'cat', 'name')
+        published = loc.for_branch('published')
+        published_course = CourseLocator('org', 'course', 'run', 'published')
+        self.assertEqual(published, BlockUsageLocator(published_course, 'cat', 'name'))
+        self.assertEqual(str(published), 'block-v1:org+course+run+branch@published+type@cat+block@name')
+        with self.assertRaises(AttributeError):
+            published.block_id = 'other'  # type: ignore
+        # Mapping between formats still checks the block id against the new format's rules
+        with self.assertRaises(InvalidKeyError):
+            BlockUsageLocator(CourseLocator('org', 'course', 'run', deprecated=True), 'cat', 'na%me').map_into_course(
+                CourseLocator('org', 'course', 'run')
+            )
 
     @ddt.data(
         (BlockUsageLocator, '_id.', 'i4x', (CourseLocator('org', 'course', 'run', 'rev', deprecated=True), 'ct', 'n')),
@@ -226,6 +372,22 @@ class TestBlockUsageLocators(LocatorBaseTest):
             key.__class__._from_deprecated_son(key.to_deprecated_son(), run)  # pylint: disable=protected-access
         )
 
+    def test_deprecated_course_key_shared(self):
+        first = UsageKey.from_string('i4x://org/course/problem/first')
+        second = UsageKey.from_string('i4x://org/course/html/second')
+        self.assertIs(first.course_key, second.course_key)
+        # pylint: disable=protected-access
+        first_son = BlockUsageLocator._from_deprecated_son(first.to_deprecated_son(), 'run')
+        second_son = BlockUsageLocator._from_deprecated_son(second.to_deprecated_son(), 'run')
+        self.assertIs(first_son.course_key, second_son.course_key)
+        self.assertEqual(first_son.course_key, CourseLocator('org', 'course', 'run', deprecated=True))
+
+    def test_deprecated_son_invalid(self):
+        son = UsageKey.from_string('i4x://org/course/problem/name').to_deprecated_son()
+        son['course'] = ['course']
+        with self.assertRaises(InvalidKeyError):
+            BlockUsageLocator._from_deprecated_son(son, 'run')  # pylint: disable=protected-access
+
     def test_block_constructor(self):
         expected_org = 'mit.eecs'
         expected_course = '6002x'
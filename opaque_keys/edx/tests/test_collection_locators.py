@@ -4,7 +4,7 @@ Tests of LibraryCollectionLocator
 import ddt
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.tests import LocatorBaseTest
-from opaque_keys.edx.locator import LibraryCollectionLocator, LibraryLocatorV2
+from opaque_keys.edx.locator import LibraryCollectionLocator, LibraryLocatorV2, LibraryUsageLocatorV2
 
 
 @ddt.ddt
@@ -62,3 +62,11 @@ class TestLibraryCollectionLocator(LocatorBaseTest):
     def test_coll_key_invalid_from_string(self):
         with self.assertRaises(InvalidKeyError):
             LibraryCollectionLocator.from_string("this-is-a-great-test")
+
+    def test_coll_key_from_string_cached(self):
+        str_key = "lib-collection:TestX:LibraryX:test-problem-bank"
+        self.assertIs(LibraryCollectionLocator.from_string(str_key), LibraryCollectionLocator.from_string(str_key))
+        lib_str = "lib:TestX:LibraryX"
+        self.assertIs(LibraryLocatorV2.from_string(lib_str), LibraryLocatorV2.from_string(lib_str))
+        usage_str = "lb:TestX:LibraryX:problem:p1"
+        self.assertIs(LibraryUsageLocatorV2.from_string(usage_str), LibraryUsageLocatorV2.from_string(usage_str))
@@ -3,6 +3,7 @@ Tests of CourseKeys and CourseLocators
 """
 import ddt
 import itertools  # pylint: disable=wrong-import-order
+import re  # pylint: disable=wrong-import-order
 
 from bson.objectid import ObjectId
 
@@ -35,6 +36,32 @@ class TestCourseKeys(LocatorBaseTest, TestDeprecated):
         with self.assertRaises(InvalidKeyError):
             CourseKey.from_string(course_id)
 
+    @ddt.data(
+        ('org~', 'course', 'run', None),
+        ('org', 'cour:se', 'run', None),
+        ('org', 'course', 'r+un', None),
+        ('', 'course', 'run', None),
+        ('org', '', 'run', None),
+        ('org', 'course', 'run', 'bra/nch'),
+        ('org', 'course', 5, None),
+        (5, 'course', 'run', None),
+        ('org', b'course', 'run', None),
+    )
+    @ddt.unpack
+    def test_invalid_deprecated_fields(self, org, course, run, branch):
+        with self.assertRaises(InvalidKeyError):
+            CourseLocator(org, course, run, branch, deprecated=True)
+
+    @ddt.data(
+        ('org', 'course', 'run', None),
+        ('org', 'course', '', None),
+        ('o%rg', 'co-urse', 'r.un', 'br~an:ch'),
+    )
+    @ddt.unpack
+    def test_valid_deprecated_fields(self, org, course, run, branch):
+        key = CourseLocator(org, course, run, branch, deprecated=True)
+        self.check_course_locn_fields(key, org=org, course=course, run=run, branch=branch)
+
     @ddt.data(
         "org/course/run/foo",
         "org/course",
@@ -107,6 +134,26 @@ class TestCourseKeys(LocatorBaseTest, TestDeprecated):
         self.assertEqual(testobj_2.html_id(), 'course-v1:' + testobj_2_string)
         self.assertEqual(testobj_2.version, test_id_2)
 
+    def test_course_constructor_object_id_reused(self):
+        version_guid = ObjectId()
+        self.assertIs(CourseLocator(version_guid=version_guid).version_guid, version_guid)
+        self.assertIs(CourseLocator.as_object_id(version_guid), version_guid)
+
+    def test_course_constructor_object_id_cached(self):
+        test_id_loc = '519665f6223ebd6980884f2b'
+        first = CourseLocator(version_guid=test_id_loc)
+        self.assertIs(CourseLocator(version_guid=test_id_loc).version_guid, first.version_guid)
+        self.assertEqual(first.version_guid, ObjectId(test_id_loc))
+        with self.assertRaises(InvalidKeyError):
+            CourseLocator.as_object_id('not-an-object-id')
+
+    def test_course_constructor_immutable(self):
+        course_key = CourseLocator('org', 'course', 'run')
+        self.assertFalse(course_key.deprecated)
+        with self.assertRaises(AttributeError):
+            course_key.org = 'other'  # type: ignore
+        self.assertEqual(course_key, CourseLocator('org', 'course', 'run', deprecated=False))
+
     @ddt.data(
         ' mit.eecs',
         'mit.eecs ',
@@ -270,6 +317,11 @@ class TestCourseKeys(LocatorBaseTest, TestDeprecated):
                 str(course_key.make_usage_key_from_deprecated_string(url))
             )
 
+    @ddt.data(5, b'abc', 'abc123')
+    def test_check_location_part_invalid(self, value):
+        with self.assertRaises(InvalidKeyError):
+            CourseLocator._check_location_part(value, re.compile(r'\d'))  # pylint: disable=protected-access
+
     def test_empty_run(self):
         with self.assertRaises(InvalidKeyError):
             CourseLocator('org', 'course', '')
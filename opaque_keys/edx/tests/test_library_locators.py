@@ -3,6 +3,7 @@ Tests of LibraryLocators
 """
 import itertools
 from unittest import TestCase
+import warnings
 
 import ddt
 from bson.objectid import ObjectId
@@ -54,6 +55,22 @@ class TestLibraryLocators(LocatorBaseTest, TestDeprecated):
             self.assertEqual(lib_key.run, 'library')
         self.assertEqual(lib_key.branch, None)
 
+    def test_deprecated_properties_warn_per_call_site(self):
+        lib_key = LibraryLocator(org='TestX', library='test-problem-bank')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('default', DeprecationWarning)
+            for _ in range(3):
+                self.assertEqual(lib_key.course, 'test-problem-bank')
+                self.assertEqual(lib_key.run, 'library')
+        self.assertEqual(len(caught), 2)
+        self.assertEqual(caught[0].filename, __file__)
+        # Escalated warnings are raised on every access, even when another class shares the message
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            for key in (lib_key, lib_key, CourseLocator('TestX', 'course', 'run')):
+                with self.assertRaises(DeprecationWarning):
+                    key.version  # pylint: disable=pointless-statement
+
     def test_constructor_using_course(self):
         org = 'TestX'
         code = 'test-problem-bank'
@@ -135,6 +152,10 @@ class TestLibraryLocators(LocatorBaseTest, TestDeprecated):
         normal_branch = lib_key.for_branch(None)
         self.assertEqual(normal_branch.branch, None)
 
+        # Keys are immutable, so no-op conversions hand back the same instance
+        self.assertIs(lib_key.for_branch('initial'), lib_key)
+        self.assertIs(lib_key.version_agnostic(), lib_key)
+
     def test_version_only_lib_key(self):
         version_only_lib_key = LibraryLocator(version_guid=ObjectId('519665f6223ebd6980884f2b'))
         self.assertEqual(version_only_lib_key.org, None)
@@ -15,6 +15,7 @@ from opaque_keys.edx.locator import (
     LibraryLocatorV2,
     LibraryUsageLocator,
     LibraryUsageLocatorV2,
+    LocalId,
 )
 from opaque_keys.edx.tests import LocatorBaseTest
 
@@ -60,6 +61,24 @@ class TestLibraryUsageLocators(LocatorBaseTest):
         self.assertIsInstance(lib_usage_key2, LibraryUsageLocator)
         self.assertIsInstance(lib_usage_key2.library_key, LibraryLocator)
 
+    def test_no_instance_dict(self):
+        lib_key = LibraryLocator(org="TestX", library="problem-bank-15")
+        usage_key = LibraryUsageLocator(library_key=lib_key, block_type="html", block_id="html1")
+        self.assertFalse(hasattr(usage_key, '__dict__'))
+
+    def test_constructor_immutable(self):
+        lib_key = LibraryLocator(org="TestX", library="problem-bank-15")
+        usage_key = LibraryUsageLocator(library_key=lib_key, block_type="html", block_id="html1", deprecated=False)
+        self.assertFalse(usage_key.deprecated)
+        with self.assertRaises(AttributeError):
+            usage_key.block_id = 'other'  # type: ignore
+        self.assertEqual(usage_key, UsageKey.from_string(str(usage_key)))
+
+    def test_non_ascii_ids(self):
+        lib_key = LibraryLocator(org="TestX", library="problem-bank-15")
+        usage_key = LibraryUsageLocator(library_key=lib_key, block_type="h\u00e9ml", block_id="na\u00efve")
+        self.assertEqual(usage_key, UsageKey.from_string(str(usage_key)))
+
     def test_no_deprecated_support(self):
         lib_key = LibraryLocator(org="TestX", library="problem-bank-15")
         with self.assertRaises(InvalidKeyError):
@@ -69,7 +88,11 @@ class TestLibraryUsageLocators(LocatorBaseTest):
         {'block_type': 'html', 'block_id': ''},
         {'block_type': '', 'block_id': 'html15'},
         {'block_type': '+$%@', 'block_id': 'html15'},
+        {'block_type': 'ht ml', 'block_id': 'html15'},
+        {'block_type': 'html', 'block_id': 'html 15'},
         {'block_type': 'html', 'block_id': '+$%@'},
+        {'block_type': None, 'block_id': 'html15'},
+        {'block_type': 'html', 'block_id': LocalId('html15')},
     )
     def test_constructor_invalid(self, kwargs):
         lib_key = LibraryLocator(org="TestX", library="problem-bank-15")
@@ -171,6 +194,14 @@ class TestLibraryUsageLocators(LocatorBaseTest):
         with self.assertRaises(NotImplementedError):
             usage.to_deprecated_son()
 
+    def test_block_type_interning(self):
+        lib_key = LibraryLocator(org="TestX", library="lib")
+        known = LibraryUsageLocator(library_key=lib_key, block_type=''.join(['prob', 'lem']), block_id="1")
+        self.assertIs(known.block_type, 'problem')
+        first = LibraryUsageLocator(library_key=lib_key, block_type=''.join(['custom', '_block']), block_id="1")
+        second = LibraryUsageLocator(library_key=lib_key, block_type=''.join(['custom', '_block']), block_id="2")
+        self.assertIsNot(first.block_type, second.block_type)
+
 
 @ddt.ddt
 class LibraryUsageLocatorV2Tests(TestCase):
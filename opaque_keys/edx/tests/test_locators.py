@@ -3,6 +3,7 @@ Tests for opaque_keys.edx.locator.
 """
 
 import random
+import sys
 from unittest import TestCase
 from uuid import UUID
 
@@ -42,6 +43,10 @@ class DefinitionLocatorTests(TestCase):
         definition_locator = DefinitionLocator('html', object_id)
         self.assertEqual(object_id, str(definition_locator.version))
 
+    def test_no_instance_dict(self):
+        definition_locator = DefinitionLocator('html', f'{random.randrange(16 ** 24):024x}')
+        self.assertFalse(hasattr(definition_locator, '__dict__'))
+
 
 @ddt.ddt
 class BundleDefinitionLocatorTests(TestCase):
@@ -142,3 +147,54 @@ class VersionTreeTests(TestCase):
         test_id = ObjectId(test_id_loc)
         valid_locator = CourseLocator(version_guid=test_id)
         self.assertEqual(VersionTree(valid_locator).children, [])
+
+    def test_version_tree_children(self):
+        root, child, grandchild, sibling = (CourseLocator(version_guid=ObjectId()) for _ in range(4))
+        tree_dict = {
+            root.version_guid: [child, sibling],
+            child.version_guid: [grandchild],
+        }
+        tree = VersionTree(root, tree_dict)
+        self.assertFalse(hasattr(tree, '__dict__'))
+        self.assertEqual(tree.locator, root)
+        self.assertIs(tree.children, tree.children)
+        self.assertEqual([subtree.locator for subtree in tree.children], [child, sibling])
+        self.assertEqual([subtree.locator for subtree in tree.children[0].children], [grandchild])
+        self.assertEqual(tree.children[0].children[0].children, [])
+        self.assertEqual(tree.children[1].children, [])
+        tree.children = []
+        self.assertEqual(tree.children, [])
+
+        with self.assertRaises(ValueError):
+            VersionTree(root, {root.version_guid: [CourseLocator(org="mit.eecs", course="6.002x", run="2014")]})
+
+    def test_deep_version_tree(self):
+        history = [CourseLocator(version_guid=ObjectId()) for _ in range(sys.getrecursionlimit() + 10)]
+        tree_dict = {parent.version_guid: [child] for parent, child in zip(history, history[1:])}
+        tree = VersionTree(history[0], tree_dict)
+        depth = 1
+        while tree.children:
+            (tree,) = tree.children
+            depth += 1
+        self.assertEqual(depth, len(history))
+
+    def test_shared_child_version_tree(self):
+        root, left, right, merge = (CourseLocator(version_guid=ObjectId()) for _ in range(4))
+        tree_dict = {
+            root.version_guid: [left, right],
+            left.version_guid: [merge],
+            right.version_guid: [merge],
+        }
+        tree = VersionTree(root, tree_dict)
+        self.assertEqual([[grandchild.locator for grandchild in child.children] for child in tree.children],
+                         [[merge], [merge]])
+
+    def test_cyclic_version_tree(self):
+        root, child, grandchild = (CourseLocator(version_guid=ObjectId()) for _ in range(3))
+        with self.assertRaises(ValueError):
+            VersionTree(root, {root.version_guid: [root]})
+        with self.assertRaises(ValueError):
+            VersionTree(root, {root.version_guid: [child], child.version_guid: [grandchild, root]})
+        with self.assertRaises(ValueError):
+            VersionTree(root, {root.version_guid: [child], child.version_guid: [grandchild],
+                               grandchild.version_guid: [child]})